@@ -1,18 +1,32 @@
-import ccxt.async_support as ccxt
-import os
+import ccxt.pro as ccxtpro
+import aiohttp
+import certifi
+import socket
+import ssl
+import sys
 import asyncio
-from itertools import combinations
+import heapq
+import numpy as np
+# ccxt parses REST and WebSocket JSON with orjson whenever it is importable; require it so that fast path is always taken
+import orjson  # noqa: F401
+from aiolimiter import AsyncLimiter
 from tabulate import tabulate
 import colorama
 import logging
+from queue import Queue
+from logging.handlers import QueueHandler, QueueListener
+from collections import namedtuple
+from functools import lru_cache
 from datetime import datetime
 from multiprocessing import Pool
 
 colorama.init()
 
-# Set up logging
-logging.basicConfig(filename='arbitrage_opportunities.log', level=logging.INFO, 
-                    format='%(asctime)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+# Terminal color codes used when rendering tables
+GREEN = '\x1b[92m'
+RED = '\x1b[91m'
+YELLOW = '\x1b[93m'
+RESET = '\x1b[0m'
 
 # Estimated fees for each exchange (these are example values, please update with accurate fees)
 FEES = {
@@ -21,181 +35,372 @@ FEES = {
     'bitfinex': 0.002,  # 0.20%
 }
 
+# Base currencies whose pairs are scanned, in display order
+BASE_CURRENCIES = ('USDT', 'BTC', 'ETH')
+BASE_SET = frozenset(BASE_CURRENCIES)
+
+EXCHANGE_IDS = ('binance', 'kraken', 'bitfinex')
+EXCHANGE_INDEX = {exchange_id: i for i, exchange_id in enumerate(EXCHANGE_IDS)}
+
+# Fee rates and the fraction of the traded amount left after them, indexed like EXCHANGE_IDS
+FEE_RATES = np.array([FEES[exchange_id] for exchange_id in EXCHANGE_IDS])
+NET_FACTORS = 1.0 - FEE_RATES
+
+# Tickers for one symbol as parallel arrays; ex_idx indexes into EXCHANGE_IDS
+SymbolData = namedtuple('SymbolData', 'bids asks volumes ex_idx')
+
+# Binance streams miniTicker by default, which carries no bid/ask
+EXCHANGE_OPTIONS = {
+    'binance': {'watchTickers': {'name': 'ticker'}},
+}
+
+# Keep pooled connections warm between scan cycles so requests skip the TCP/TLS handshake
+KEEPALIVE_TIMEOUT = 75
+KEEPALIVE_HEADERS = {'Connection': 'keep-alive', 'Keep-Alive': f'timeout={KEEPALIVE_TIMEOUT}, max=1000'}
+
+def create_session():
+    # One connection pool and DNS cache shared by every exchange. ccxt uses this connector for REST and
+    # WebSocket traffic, so it carries the same certifi trust store and Happy Eyeballs settings ccxt's own has
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=32, ttl_dns_cache=300,
+                                     keepalive_timeout=KEEPALIVE_TIMEOUT, enable_cleanup_closed=True,
+                                     ssl=ssl.create_default_context(cafile=certifi.where()),
+                                     family=socket.AF_UNSPEC, happy_eyeballs_delay=0)
+    return aiohttp.ClientSession(connector=connector)
+
+def create_exchange(exchange_id, session):
+    return getattr(ccxtpro, exchange_id)({'session': session, 'headers': KEEPALIVE_HEADERS,
+                                          'options': EXCHANGE_OPTIONS.get(exchange_id, {})})
+
+# Leaky-bucket REST request budgets per exchange (requests per 60 seconds)
+LIMITERS = {
+    'binance': AsyncLimiter(1200, 60),
+    'kraken': AsyncLimiter(60, 60),
+    'bitfinex': AsyncLimiter(90, 60),
+}
+
+# Number of most profitable opportunities logged per scan
+TOP_K = 50
+
+# Seconds between REST polls for exchanges without a watchTickers stream
+POLL_INTERVAL = 5
+
+# Scan once no ticker update has arrived for DEBOUNCE_SECONDS, but at least every MAX_DEBOUNCE_SECONDS
+DEBOUNCE_SECONDS = 0.05
+MAX_DEBOUNCE_SECONDS = 1
+
+def setup_logging():
+    # Records are queued on the event loop thread and written to disk by the listener's thread
+    file_handler = logging.FileHandler('arbitrage_opportunities.log')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S'))
+    log_queue = Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    return listener
+
+def format_ticker(exchange, symbol, ticker):
+    if ticker['ask'] == 0 or ticker['bid'] == 0:
+        logging.warning(f"Zero price detected for {symbol} on {exchange.id}: Ask: {ticker['ask']}, Bid: {ticker['bid']}")
+    return {
+        'symbol': symbol,
+        'exchange': exchange.id,
+        'ask': ticker['ask'],
+        'bid': ticker['bid'],
+        'volume': ticker['baseVolume']
+    }
+
 async def fetch_ticker(exchange, symbol):
     try:
-        ticker = await exchange.fetch_ticker(symbol)
-        if ticker['ask'] == 0 or ticker['bid'] == 0:
-            logging.warning(f"Zero price detected for {symbol} on {exchange.id}: Ask: {ticker['ask']}, Bid: {ticker['bid']}")
-        return {
-            'symbol': symbol,
-            'exchange': exchange.id,
-            'ask': ticker['ask'],
-            'bid': ticker['bid'],
-            'volume': ticker['baseVolume']
-        }
+        async with LIMITERS[exchange.id]:
+            ticker = await exchange.fetch_ticker(symbol)
+        return format_ticker(exchange, symbol, ticker)
     except Exception as e:
         logging.error(f"Error fetching {symbol} from {exchange.id}: {str(e)}")
         return None
 
-async def fetch_all_tickers(exchanges, symbols):
-    tasks = [fetch_ticker(exchange, symbol) for exchange in exchanges for symbol in symbols]
-    return await asyncio.gather(*tasks)
+async def fetch_exchange_tickers(exchange, symbols):
+    # One batch request per exchange where supported, otherwise one request per symbol
+    if not exchange.has['fetchTickers']:
+        return await asyncio.gather(*[fetch_ticker(exchange, symbol) for symbol in symbols])
+    try:
+        async with LIMITERS[exchange.id]:
+            tickers = await exchange.fetch_tickers(symbols)
+    except Exception as e:
+        logging.error(f"Error fetching tickers from {exchange.id}: {str(e)}")
+        return []
+    return [format_ticker(exchange, symbol, ticker) for symbol, ticker in tickers.items()]
 
-async def scan_arbitrage(exchanges, symbols):
-    all_results = await fetch_all_tickers(exchanges, symbols)
-    
-    # Group results by symbol
-    grouped_results = {}
+def exchange_down(exchange_id, symbols=None):
+    # Queue marker telling the consumer to drop an exchange's quotes, all of them when symbols is None
+    return {'exchange': exchange_id, 'down': True, 'symbols': symbols}
+
+async def poll_tickers(exchange, symbols, queue):
+    while True:
+        results = [result for result in await fetch_exchange_tickers(exchange, symbols) if result is not None]
+        received = {result['symbol'] for result in results}
+        missing = frozenset(symbol for symbol in symbols if symbol not in received)
+        if missing:
+            queue.put_nowait(exchange_down(exchange.id, missing))
+        for result in results:
+            queue.put_nowait(result)
+        await asyncio.sleep(POLL_INTERVAL)
+
+async def stream_tickers(exchange, symbols, queue):
+    if not exchange.has['watchTickers']:
+        return await poll_tickers(exchange, symbols, queue)
+    while True:
+        try:
+            # Only tickers that changed since the previous call are returned
+            tickers = await exchange.watch_tickers(symbols)
+        except Exception as e:
+            logging.error(f"Error watching tickers on {exchange.id}: {str(e)}")
+            queue.put_nowait(exchange_down(exchange.id))
+            await asyncio.sleep(POLL_INTERVAL)
+            continue
+        for symbol, ticker in tickers.items():
+            queue.put_nowait(format_ticker(exchange, symbol, ticker))
+
+def apply_update(snapshot, update):
+    if not update.get('down'):
+        snapshot[(update['exchange'], update['symbol'])] = update
+        return
+    stale_symbols = update['symbols']
+    for key in [key for key in snapshot if key[0] == update['exchange']]:
+        if stale_symbols is None or key[1] in stale_symbols:
+            del snapshot[key]
+
+async def drain_updates(queue, snapshot):
+    loop = asyncio.get_running_loop()
+    result = await queue.get()
+    deadline = loop.time() + MAX_DEBOUNCE_SECONDS
+    while True:
+        apply_update(snapshot, result)
+        timeout = min(DEBOUNCE_SECONDS, deadline - loop.time())
+        if timeout <= 0:
+            return
+        try:
+            result = await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return
+
+def group_results(all_results):
+    rows_by_symbol = {}
     for result in all_results:
         if result is not None:
-            symbol = result['symbol']
-            if symbol not in grouped_results:
-                grouped_results[symbol] = []
-            grouped_results[symbol].append(result)
+            rows_by_symbol.setdefault(result['symbol'], []).append(
+                (result['bid'], result['ask'], result['volume'], EXCHANGE_INDEX[result['exchange']]))
+    
+    grouped_results = {}
+    for symbol, rows in rows_by_symbol.items():
+        bids, asks, volumes, ex_idx = zip(*rows)
+        # Missing prices or volumes become NaN, which fails every comparison below
+        grouped_results[symbol] = SymbolData(np.array(bids, dtype=float), np.array(asks, dtype=float),
+                                             np.array(volumes, dtype=float), np.array(ex_idx, dtype=np.int8))
+    return grouped_results
+
+def scan_arbitrage(all_results):
+    grouped_results = group_results(all_results)
     
     arbitrage_opportunities = []
     arbitrage_before_fees = {}
     
-    for symbol, results in grouped_results.items():
-        if not results:
-            arbitrage_before_fees[symbol] = None
+    for symbol, data in grouped_results.items():
+        bids, asks = data.bids, data.asks
+        
+        # fmax/fmin skip NaN entries, so one exchange missing a price does not hide the others
+        max_diff = float(np.fmax.reduce(bids) - np.fmin.reduce(asks))
+        arbitrage_before_fees[symbol] = max_diff if max_diff > 0 else None
+        # No bid crosses any ask, so there is no pair to evaluate
+        if not max_diff > 0:
             continue
         
-        base_currency = symbol.split('/')[-1]
+        fees = FEE_RATES[data.ex_idx]
+        net_factors = NET_FACTORS[data.ex_idx]
         
-        highest_bid = max(result['bid'] for result in results)
-        lowest_ask = min(result['ask'] for result in results)
-        max_diff = highest_bid - lowest_ask
-        arbitrage_before_fees[symbol] = max_diff if max_diff > 0 else None
+        # profit[i, j] is the net return of buying 1 unit on exchange j and selling on exchange i
+        with np.errstate(divide='ignore', invalid='ignore'):
+            profit = net_factors[None, :] / asks[None, :] * bids[:, None] * net_factors[:, None] - 1
+        # Every ordered pair of distinct exchanges, so both trade directions are covered
+        crossed = (bids[:, None] > asks[None, :]) & (asks[None, :] > 0)
+        np.fill_diagonal(crossed, False)
         
-        for (exchange1, exchange2) in combinations(results, 2):
-            if exchange1['bid'] > exchange2['ask'] and exchange2['ask'] > 0:
-                buy_price = exchange2['ask']
-                sell_price = exchange1['bid']
-                buy_fee = buy_price * FEES[exchange2['exchange']]
-                sell_fee = sell_price * FEES[exchange1['exchange']]
-                
-                crypto_amount = (1 - FEES[exchange2['exchange']]) / buy_price
-                sell_amount = (crypto_amount * sell_price) * (1 - FEES[exchange1['exchange']])
-                
-                net_profit = sell_amount - 1
-                profit_percentage = (net_profit / 1) * 100
-                
-                arbitrage_opportunities.append({
-                    'symbol': symbol,
-                    'buy_at': exchange2['exchange'],
-                    'sell_at': exchange1['exchange'],
-                    'buy_price': buy_price,
-                    'sell_price': sell_price,
-                    'fees': buy_fee + sell_fee,
-                    'net_profit': net_profit,
-                    'profit_percentage': profit_percentage,
-                    'volume': min(exchange1['volume'], exchange2['volume'])
-                })
-    
-    arbitrage_opportunities.sort(key=lambda x: x['profit_percentage'], reverse=True)
+        for i, j in zip(*np.nonzero(crossed)):
+            buy_price = float(asks[j])
+            sell_price = float(bids[i])
+            buy_fee = buy_price * fees[j]
+            sell_fee = sell_price * fees[i]
+            
+            net_profit = float(profit[i, j])
+            profit_percentage = net_profit * 100
+            
+            arbitrage_opportunities.append({
+                'symbol': symbol,
+                'buy_at': EXCHANGE_IDS[data.ex_idx[j]],
+                'sell_at': EXCHANGE_IDS[data.ex_idx[i]],
+                'buy_price': buy_price,
+                'sell_price': sell_price,
+                'fees': float(buy_fee + sell_fee),
+                'net_profit': net_profit,
+                'profit_percentage': profit_percentage,
+                # np.minimum propagates NaN: with one side's volume unknown, the tradeable volume is unknown too
+                'volume': float(np.minimum(data.volumes[i], data.volumes[j]))
+            })
     
     return arbitrage_opportunities, grouped_results, arbitrage_before_fees
 
-def create_table(exchanges, symbols, opportunities, all_results, arbitrage_before_fees):
-    if not symbols:
-        return "No data available for this base currency."
+def color_value(value, spec, suffix=''):
+    return ''.join((GREEN if value > 0 else RED, format(value, spec), suffix, RESET))
 
-    headers = ['Symbol', 'Arbitrage Before Fees'] + \
-              [f"{e.id}\nBid/Ask/Volume" for e in exchanges] + \
-              ['Fees', 'Net Profit', 'Profit %', 'Min Volume']
+@lru_cache(maxsize=None)
+def table_headers(exchange_ids):
+    return (('Symbol', 'Arbitrage Before Fees') +
+            tuple(f"{exchange_id}\nBid/Ask/Volume" for exchange_id in exchange_ids) +
+            ('Fees', 'Net Profit', 'Profit %', 'Min Volume'))
+
+def create_table(exchanges, grouped_symbols, opportunities, all_results, arbitrage_before_fees):
+    headers = table_headers(tuple(e.id for e in exchanges))
+    padding = [''] * (len(headers) - 1)
     table = []
     
-    for symbol in symbols:
-        row = [symbol]
-        
-        arb_before = arbitrage_before_fees.get(symbol)
-        if arb_before is not None:
-            arb_before_str = f"\033[92m{arb_before:.2f}\033[0m" if arb_before > 0 else f"\033[91m{arb_before:.2f}\033[0m"
-        else:
-            arb_before_str = "N/A"
-        row.append(arb_before_str)
-        
-        results = all_results.get(symbol, [])
-        for exchange in exchanges:
-            exchange_data = next((r for r in results if r['exchange'] == exchange.id), None)
-            if exchange_data:
-                cell = f"{exchange_data['bid']:.2f}/{exchange_data['ask']:.2f}/{exchange_data['volume']:.2f}"
+    # Keep only the most profitable opportunity per symbol
+    ops_by_symbol = {}
+    for o in opportunities:
+        best = ops_by_symbol.get(o['symbol'])
+        if best is None or o['profit_percentage'] > best['profit_percentage']:
+            ops_by_symbol[o['symbol']] = o
+    
+    # All base currencies share one table, each section introduced by a label row
+    for base_currency in BASE_CURRENCIES:
+        symbols = grouped_symbols[base_currency]
+        label = f"{base_currency} Pairs" if symbols else f"{base_currency} Pairs: no data"
+        table.append([label] + padding)
+        for symbol in symbols:
+            row = [symbol]
+            
+            arb_before = arbitrage_before_fees.get(symbol)
+            if arb_before is not None:
+                arb_before_str = color_value(arb_before, '.2f')
             else:
-                cell = "N/A"
-            row.append(cell)
-        
-        op = next((o for o in opportunities if o['symbol'] == symbol), None)
-        if op:
-            fees_str = f"\033[93m{op['fees']:.4f}\033[0m"
-            net_profit_str = f"\033[92m{op['net_profit']:.4f}\033[0m" if op['net_profit'] > 0 else f"\033[91m{op['net_profit']:.4f}\033[0m"
-            profit_pct_str = f"\033[92m{op['profit_percentage']:.2f}%\033[0m" if op['profit_percentage'] > 0 else f"\033[91m{op['profit_percentage']:.2f}%\033[0m"
-            row.append(fees_str)
-            row.append(net_profit_str)
-            row.append(profit_pct_str)
-            row.append(f"{op['volume']:.2f}")
-        else:
-            row.extend(["N/A", "N/A", "N/A", "N/A"])
-        
-        table.append(row)
+                arb_before_str = "N/A"
+            row.append(arb_before_str)
+            
+            cells = {}
+            data = all_results.get(symbol)
+            if data is not None:
+                for k, idx in enumerate(data.ex_idx):
+                    cells[EXCHANGE_IDS[idx]] = f"{data.bids[k]:.2f}/{data.asks[k]:.2f}/{data.volumes[k]:.2f}"
+            for exchange in exchanges:
+                row.append(cells.get(exchange.id, "N/A"))
+            
+            op = ops_by_symbol.get(symbol)
+            if op:
+                fees_str = ''.join((YELLOW, format(op['fees'], '.4f'), RESET))
+                net_profit_str = color_value(op['net_profit'], '.4f')
+                profit_pct_str = color_value(op['profit_percentage'], '.2f', '%')
+                row.append(fees_str)
+                row.append(net_profit_str)
+                row.append(profit_pct_str)
+                row.append(f"{op['volume']:.2f}")
+            else:
+                row.extend(["N/A", "N/A", "N/A", "N/A"])
+            
+            table.append(row)
     
     return tabulate(table, headers=headers, tablefmt="grid")
-def get_valid_pairs(common_symbols):
-    base_currencies = ['USDT', 'BTC', 'ETH']
-    valid_pairs = []
-    for symbol in common_symbols:
-        base = symbol.split('/')[-1]
-        if base in base_currencies:
-            valid_pairs.append(symbol)
-    return valid_pairs
-
-def group_symbols_by_base(symbols):
-    grouped = {'USDT': [], 'BTC': [], 'ETH': []}
+
+# Common symbols keyed on the identity of each exchange's markets dict, which ccxt replaces on reload
+_symbols_cache = {'key': None, 'markets': None, 'symbols': None}
+
+def compute_symbols(exchanges):
+    markets = tuple(exchange.markets for exchange in exchanges)
+    key = tuple(id(m) for m in markets)
+    if _symbols_cache['key'] != key:
+        # Start from the smallest symbol set so every intersection step stays small
+        symbol_sets = sorted((frozenset(exchange.symbols) for exchange in exchanges), key=len)
+        common_symbols = set(symbol_sets[0])
+        for symbol_set in symbol_sets[1:]:
+            common_symbols.intersection_update(symbol_set)
+        # Holding on to the markets keeps their ids from being reused by other objects
+        _symbols_cache.update(key=key, markets=markets, symbols=tuple(sorted(common_symbols)))
+    return _symbols_cache['symbols']
+
+def get_valid_pairs(common_symbols, bases):
+    return [symbol for symbol in common_symbols if bases[symbol] in BASE_SET]
+
+def group_symbols_by_base(symbols, bases):
+    grouped = {base: [] for base in BASE_CURRENCIES}
     for symbol in symbols:
-        base = symbol.split('/')[-1]
+        base = bases[symbol]
         if base in grouped:
             grouped[base].append(symbol)
     return grouped
 
 async def continuous_arbitrage_scan():
-    exchange_ids = ['binance', 'kraken', 'bitfinex']
-    exchanges = [getattr(ccxt, exchange_id)() for exchange_id in exchange_ids]
+    # ccxt does not close sessions it was given, so the shared session is closed below
+    session = create_session()
+    exchanges = [create_exchange(exchange_id, session) for exchange_id in EXCHANGE_IDS]
     
     await asyncio.gather(*[exchange.load_markets() for exchange in exchanges])
     
-    common_symbols = set.intersection(*[set(exchange.symbols) for exchange in exchanges])
-    symbols = get_valid_pairs(common_symbols)
-    grouped_symbols = group_symbols_by_base(symbols)
+    common_symbols = compute_symbols(exchanges)
+    bases = {symbol: symbol.rpartition('/')[2] for symbol in common_symbols}
+    symbols = get_valid_pairs(common_symbols, bases)
+    grouped_symbols = group_symbols_by_base(symbols, bases)
+
+    queue = asyncio.Queue()
+    
+    def producer_done(task):
+        # Producers loop forever, so any exit other than cancellation is a failure
+        if task.cancelled():
+            return
+        logging.error(f"Ticker producer for {task.get_name()} stopped: {task.exception()!r}")
+        queue.put_nowait(exchange_down(task.get_name()))
+    
+    producers = []
+    for exchange in exchanges:
+        producer = asyncio.create_task(stream_tickers(exchange, symbols, queue), name=exchange.id)
+        producer.add_done_callback(producer_done)
+        producers.append(producer)
+    snapshot = {}
 
     try:
         while True:
-            opportunities, all_results, arbitrage_before_fees = await scan_arbitrage(exchanges, symbols)
+            await drain_updates(queue, snapshot)
+            if all(producer.done() for producer in producers):
+                raise RuntimeError("All ticker producers have stopped") from producers[0].exception()
+            opportunities, all_results, arbitrage_before_fees = scan_arbitrage(snapshot.values())
             
-            os.system('cls' if os.name == 'nt' else 'clear')
+            # colorama.init() makes this escape sequence work on Windows consoles as well
+            sys.stdout.write('\x1b[2J\x1b[H')
+            sys.stdout.flush()
             
-            for base_currency in ['USDT', 'BTC', 'ETH']:
-                base_symbols = grouped_symbols[base_currency]
-                base_opportunities = [op for op in opportunities if op['symbol'] in base_symbols]
-                base_results = {symbol: results for symbol, results in all_results.items() if symbol in base_symbols}
-                base_arbitrage_before_fees = {k: v for k, v in arbitrage_before_fees.items() if k in base_symbols}
-                
-                table = create_table(exchanges, base_symbols, base_opportunities, base_results, base_arbitrage_before_fees)
-                print(f"\n{base_currency} Pairs:")
-                print(table)
+            print(create_table(exchanges, grouped_symbols, opportunities, all_results, arbitrage_before_fees))
             
             if opportunities:
-                for op in opportunities:
-                    color = "\033[92m" if op['net_profit'] > 0 else "\033[91m"
-                    reset = "\033[0m"
-                    log_message = (f"{op['symbol']}: Buy at {op['buy_at']} for {op['buy_price']:.8f}, "
-                                   f"Sell at {op['sell_at']} for {op['sell_price']:.8f}, "
-                                   f"Fees: {op['fees']:.8f}, Net Profit: {op['net_profit']:.8f}, "
-                                   f"Profit: {op['profit_percentage']:.2f}%, Volume: {op['volume']:.8f}")
-                    logging.info(f"{color}{log_message}{reset}")
-            
-            await asyncio.sleep(5)
+                top_opportunities = heapq.nlargest(TOP_K, opportunities, key=lambda x: x['profit_percentage'])
+                # One record per scan keeps logging to a single lock acquisition and write
+                logging.info('\n'.join(f"{op['symbol']}: Buy at {op['buy_at']} for {op['buy_price']:.8f}, "
+                                       f"Sell at {op['sell_at']} for {op['sell_price']:.8f}, "
+                                       f"Fees: {op['fees']:.8f}, Net Profit: {op['net_profit']:.8f}, "
+                                       f"Profit: {op['profit_percentage']:.2f}%, Volume: {op['volume']:.8f}"
+                                       for op in top_opportunities))
     finally:
+        for producer in producers:
+            producer.cancel()
+        await asyncio.gather(*producers, return_exceptions=True)
         await asyncio.gather(*[exchange.close() for exchange in exchanges])
+        await session.close()
 
 if __name__ == "__main__":
-    asyncio.run(continuous_arbitrage_scan())
\ No newline at end of file
+    # uvloop is not available on Windows; fall back to the default event loop there
+    try:
+        from uvloop import run
+    except ImportError:
+        from asyncio import run
+    listener = setup_logging()
+    try:
+        run(continuous_arbitrage_scan())
+    finally:
+        listener.stop()
\ No newline at end of file